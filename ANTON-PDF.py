@@ -1,18 +1,24 @@
+import io
+import multiprocessing
 import os
 import os.path
 import sys
 import time
 import requests
 import certifi
-import csv
 import string
 import urllib.parse
-import qrcode
+import segno
 import codecs
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pypdf import PdfWriter
 from reportlab.lib.enums import TA_JUSTIFY
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+import pandas as pd
 from tabulate import tabulate
 from bs4 import BeautifulSoup
 from datetime import datetime
@@ -35,13 +41,6 @@ from datetime import datetime
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-print("")
-print("Copyright (C) 2020 Johannes Schirge (Shen@github)")
-print("This program comes with ABSOLUTELY NO WARRANTY")
-print("This is free software, and you are welcome to redistribute it under certain conditions.")
-print("For details look into LICENSE file (GNU GPLv3).")
-print("")
-
 
 # determine if running in a build package (frozen) or from seperate python script
 frozen = 'not'
@@ -54,208 +53,255 @@ else:
   appdir = os.path.dirname(os.path.abspath(__file__))
   ## print("Executable is run in normal Python environment, appdir set to: " + appdir) # for debug
 
-# read config from xml file
-configfile = codecs.open(os.path.join(appdir,'config.xml'),mode='r', encoding='utf-8')
-config = configfile.read()
-configfile.close()
-
-# load config values into variables
-config_xmlsoup = BeautifulSoup(config, "html.parser") # parse
-config_csvfile = config_xmlsoup.find('csvfile').string
-config_csvDelimiter = config_xmlsoup.find('csvdelimiter').string
-config_pdfOneDoc = config_xmlsoup.find('pdfonedoc').string
-config_schoolgroup = config_xmlsoup.find('schoolgroup').string
-
-
-# ANTON Info-Text
-print("")
-print("###################################################################################")
-print("# ANTON PDF-Generator                                                             #")
-print("# Dieses Tool erstellt PDF-Dateien mit den ANTON-Nutzernamen aus einer CSV-Datei. #")
-print("###################################################################################")
-print("")
-print("")
-print("Wenn du sicher bist, dass deine Einstellungen in der config.xml korrekt sind,")
-print("drücke eine beliebige Taste, um fortzufahren.")
-input("Andernfalls breche den Prozess mit [STRG + C] ab.")
-print("")
-print("Alles klar! Dann fangen wir mal an.")
-print("")  
-
-# check if user-import-csv-file exists
-if not os.path.isfile(config_csvfile):
-      print("FEHLER!")
-      print("Die csv-Datei (" + config_csvfile + "), die Sie in der config.xml eingetragen haben, existiert nicht. Bitte speichern Sie die Datei '" + config_csvfile + "' im Hauptverzeichnis des Scripts oder bearbeiten Sie die config.xml")
-      input("Drücken Sie eine beliebige Taste, um zu bestätigen und den Prozess zu beenden.")  
-      sys.exit(1)
 
-# set/create output-directory
-output_dir = 'output'
-if not os.path.exists(output_dir):
-  os.makedirs(output_dir)
-
-# set/create temporary-directory
-tmp_dir = 'tmp'
-if not os.path.exists(tmp_dir):
-  os.makedirs(tmp_dir)
-
-# adds date and time as string to variable
-today = datetime.now().strftime('%Y-%m-%d_%H-%M-%S') 
-
-# QR-Code class
-qr = qrcode.QRCode(
-    version=1,
-    error_correction=qrcode.constants.ERROR_CORRECT_L,
-    box_size=10,
-    border=4,
-)
-
-# display expected results for ANTON-users
-print("")
-print("Hier eine Übersicht der importierten Nutzer:")
-print("") 
-usertable = [["Vorname","Name","Klasse","Referenz", "Login-Code"]]
-with codecs.open(os.path.join(appdir, config_csvfile),mode='r', encoding='utf-8') as csvfile:
-  readCSV = csv.reader(csvfile, delimiter=config_csvDelimiter)
-  next(readCSV, None)  # skip the headers
-  for row in readCSV:
-    if (len(row) != 5): # check if number of columns is consistent
-      print("FEHLER: Die Reihe des Nutzers",row[1],"hat",len(row),"Spalten. Es müssen 5 sein. Bitte korrigiere die csv-Datei.")
+# pdf-styles, built once per process (re-building the stylesheet per row would
+# also raise a duplicate-key error on the second styles.add)
+styles = getSampleStyleSheet()
+styles.add(ParagraphStyle(name='Justify', alignment=TA_JUSTIFY))
+normal_style = styles["Normal"]
+heading1_style = styles["Heading1"]
+justify_style = styles["Justify"]
+
+# static pdf-content, built once per process; only the name, link and
+# login-code paragraphs change per row, everything else is reused as-is
+SPACER_12 = Spacer(1, 12)
+SPACER_24 = Spacer(1, 24)
+WELCOME_P = Paragraph('<font size=14>Willkommen bei ANTON – der Lern-App für die Schule.</font>', normal_style)
+ACCOUNT_P = Paragraph('<font size=14>Für dich wurde ein Account angelegt.</font>', normal_style)
+BROWSER_P = Paragraph('<font size=14>Gehe im Browser auf </font>', normal_style)
+APP_P = Paragraph('<font size=14>oder lade dir die kostenlose ANTON-App herunter.</font>', normal_style)
+CODE_PROMPT_P = Paragraph('<font size=14>Du kannst dich mit folgendem Code bei ANTON einloggen:</font>', normal_style)
+QR_PROMPT_P = Paragraph('<font size=14>Oder du scannst in der ANTON-App diesen QR-Code:</font>', normal_style)
+
+
+# ANTON-Logo; platypus.Image erwartet den Pfad und liest lazy erst beim build
+ANTON_LOGO_PATH = "assets/ANTON_Logo.jpg"
+
+# one reusable QR buffer per process; safe because doc.build finishes inside
+# each render_user call, so the buffer is never referenced across rows
+_QR_BUF = io.BytesIO()
+
+
+@dataclass(frozen=True)
+class RenderConfig:
+  """Small picklable config passed to worker processes (instead of the BeautifulSoup object)."""
+  pdfOneDoc: str
+  schoolgroup: str
+  output_dir: str
+  today: str
+
+
+def render_user(row, cfg: RenderConfig):
+  """Render one user page. Must stay a top-level function so it is picklable.
+
+  Writes a single PDF per user if cfg.pdfOneDoc == 'nein' (returns None),
+  otherwise returns the rendered single-page PDF as bytes for merging.
+  """
+  print("Vorname:",row[0],"| Nachname:",row[1],"| Klasse: ",row[2],"| Referenz:",row[3],"| Login-Code:",row[4],)
+
+  # generate qr-code in-memory (segno encodes orders of magnitude faster than the old qrcode lib)
+  qr_buf = _QR_BUF
+  qr_buf.seek(0)
+  qr_buf.truncate(0)
+  # micro=False: Micro-QR-Codes lesen viele Scanner-Apps nicht
+  segno.make(row[4], error='L', micro=False).save(qr_buf, kind='png', scale=10, border=4)
+  qr_buf.seek(0)
+
+  # prepare pdf-output
+  if cfg.pdfOneDoc == 'nein':
+    output_filename = row[2] + "_" + row[1] + "_" + row[0] + "_" + cfg.today + ".pdf"
+    output_filepath = os.path.join( cfg.output_dir, output_filename )
+    doc = SimpleDocTemplate(output_filepath, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=18, bottomMargin=18)
+  else:
+    pdf_buffer = io.BytesIO()
+    doc = SimpleDocTemplate(pdf_buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=18, bottomMargin=18)
+
+  Story=[]
+
+  if cfg.schoolgroup == '1': #Schüler
+    antonfirstname = row[0]
+    antonsurname = row[1]
+    antonclass = row[2]
+    antonreference = row[3]
+    antonlogincode = row[4]
+    antonlink = "https://www.anton.app"
+
+  if cfg.schoolgroup == '2': #Lehrer
+    antonfirstname = row[0]
+    antonsurname = row[1]
+    antonclass = row[2]
+    antonreference = row[3]
+    antonlogincode = row[4]
+    antonlink = "https://www.anton.app"
+
+  # adds anton-logo to pdf-file
+  im = Image(ANTON_LOGO_PATH, 150, 150)
+  Story.append(im)
+  #Story.append(Spacer(1, 12))
+
+  # adds text to pdf-file
+  ptext = '<font size=14>Hallo %s!</font>' % antonfirstname
+  Story.append(Paragraph(ptext, justify_style))
+  Story.append(SPACER_12)
+
+  Story.append(WELCOME_P)
+  Story.append(SPACER_12)
+
+  Story.append(ACCOUNT_P)
+  Story.append(SPACER_24)
+
+  Story.append(BROWSER_P)
+  Story.append(SPACER_12)
+
+  ptext = '<font size=18>%s</font>' % antonlink
+  Story.append(Paragraph(ptext, normal_style))
+  Story.append(SPACER_12)
+
+  Story.append(APP_P)
+  Story.append(SPACER_24)
+
+  Story.append(CODE_PROMPT_P)
+  Story.append(SPACER_24)
+
+  ptext = '<font size=24>%s</font>' % antonlogincode
+  Story.append(Paragraph(ptext, heading1_style))
+  Story.append(SPACER_24)
+
+  Story.append(QR_PROMPT_P)
+  Story.append(SPACER_12)
+
+  # adds qr-code to pdf-file (Story keeps a reference to qr_buf until doc.build is done)
+  im2 = Image(qr_buf, 200, 200)
+  Story.append(im2)
+  del im2
+
+  # create pdf-file (single document per user or one page for the merged document)
+  doc.build(Story)
+  if cfg.pdfOneDoc == 'nein':
+    return None
+  return pdf_buffer.getvalue()
+
+
+def main():
+  print("")
+  print("Copyright (C) 2020 Johannes Schirge (Shen@github)")
+  print("This program comes with ABSOLUTELY NO WARRANTY")
+  print("This is free software, and you are welcome to redistribute it under certain conditions.")
+  print("For details look into LICENSE file (GNU GPLv3).")
+  print("")
+
+  # read config from xml file
+  configfile = codecs.open(os.path.join(appdir,'config.xml'),mode='r', encoding='utf-8')
+  config = configfile.read()
+  configfile.close()
+
+  # load config values into variables
+  config_xmlsoup = BeautifulSoup(config, "html.parser") # parse
+  config_csvfile = config_xmlsoup.find('csvfile').string
+  config_csvDelimiter = config_xmlsoup.find('csvdelimiter').string
+  config_pdfOneDoc = config_xmlsoup.find('pdfonedoc').string
+  config_schoolgroup = config_xmlsoup.find('schoolgroup').string
+
+  # ANTON Info-Text
+  print("")
+  print("###################################################################################")
+  print("# ANTON PDF-Generator                                                             #")
+  print("# Dieses Tool erstellt PDF-Dateien mit den ANTON-Nutzernamen aus einer CSV-Datei. #")
+  print("###################################################################################")
+  print("")
+  print("")
+  print("Wenn du sicher bist, dass deine Einstellungen in der config.xml korrekt sind,")
+  print("drücke eine beliebige Taste, um fortzufahren.")
+  input("Andernfalls breche den Prozess mit [STRG + C] ab.")
+  print("")
+  print("Alles klar! Dann fangen wir mal an.")
+  print("")
+
+  # check if user-import-csv-file exists
+  if not os.path.isfile(config_csvfile):
+        print("FEHLER!")
+        print("Die csv-Datei (" + config_csvfile + "), die Sie in der config.xml eingetragen haben, existiert nicht. Bitte speichern Sie die Datei '" + config_csvfile + "' im Hauptverzeichnis des Scripts oder bearbeiten Sie die config.xml")
+        input("Drücken Sie eine beliebige Taste, um zu bestätigen und den Prozess zu beenden.")
+        sys.exit(1)
+
+  # set/create output-directory
+  output_dir = 'output'
+  if not os.path.exists(output_dir):
+    os.makedirs(output_dir)
+
+  # adds date and time as string to variable
+  today = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+
+  # read rows from CSV file (once, via pandas' C parser); index_col=False
+  # verhindert, dass Zeilen mit zu vielen Feldern still als Index gedeutet
+  # werden -- der Parser meldet sie stattdessen als Fehler
+  try:
+    df = pd.read_csv(os.path.join(appdir, config_csvfile), sep=config_csvDelimiter, dtype=str, keep_default_na=False, index_col=False)
+  except pd.errors.ParserError:
+    print("FEHLER: Mindestens eine Reihe der csv-Datei hat mehr als 5 Spalten. Bitte korrigiere die csv-Datei.")
+    input("Drücke eine beliebige Taste, um den Prozess zu beenden.")
+    sys.exit(1)
+  if df.shape[1] != 5: # check if number of columns is consistent
+    print("FEHLER: Die csv-Datei hat",df.shape[1],"Spalten. Es müssen 5 sein. Bitte korrigiere die csv-Datei.")
+    input("Drücke eine beliebige Taste, um den Prozess zu beenden.")
+    sys.exit(1)
+  rows = df.values.tolist()
+  # zu kurze Zeilen füllt pandas still mit NaN auf -> wie früher pro Reihe ablehnen
+  for row in rows:
+    filled = sum(1 for x in row if not pd.isna(x))
+    if filled != 5:
+      print("FEHLER: Die Reihe des Nutzers",row[1],"hat",filled,"Spalten. Es müssen 5 sein. Bitte korrigiere die csv-Datei.")
       input("Drücke eine beliebige Taste, um den Prozess zu beenden.")
       sys.exit(1)
-    line = row[0]
-    currentuser = [row[0],row[1],row[2],row[3],row[4]]
-    usertable.append(currentuser)
-print(tabulate(usertable,headers="firstrow"))
-
-# ask user to check values and continue
-print("\nÜberprüfe, ob die Daten für die zu generierenden PDF-Dateien korrekt sind.")
-input("Wenn alles gut aussieht, drücke eine beliebige Taste, um fortzufahren. Wenn nicht, drücke Strg+C, um abzubrechen.")
-print("\nUnd los geht's. Ich erstelle nun die PDF-Datei(en).\n")
-print("\nDies kann eine Weile dauern. Gönn dir einen Kaffee oder Tee.\n")
-
-# prepare pdf-output (if pdfOneDoc == ja)
-if config_pdfOneDoc == 'ja':
-  output_filename = "Nutzerliste_" + today + ".pdf"
-  output_filepath = os.path.join( output_dir, output_filename )
-  doc = SimpleDocTemplate(output_filepath, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=18, bottomMargin=18)
-
-# prepare pdf-content
-Story=[]
-
-# read rows from CSV file
-with codecs.open(os.path.join(appdir, config_csvfile),mode='r', encoding='utf-8') as csvfile:
-  readCSV = csv.reader(csvfile, delimiter=config_csvDelimiter)
-  next(readCSV, None)  # skip the headers
-  for row in readCSV:
-    line = row[0]
-    print("Vorname:",row[0],"| Nachname:",row[1],"| Klasse: ",row[2],"| Referenz:",row[3],"| Login-Code:",row[4],)
-  # build the dataset for the request
-    data = [
-      ('firstname', row[0]),
-      ('surname', row[1]), 
-      ('class', row[2]),
-      ('reference', row[3]),
-      ('logincode', row[4]),
-      ]
-
-    # generate qr-code
-    qr.add_data(row[4])
-    img = qr.make_image(fill_color="black", back_color="white")
-    img.save(os.path.join( tmp_dir, row[2] + "_" + row[1] + "_" + row[0] + ".jpg" ))
-    qr.clear()
-
-      # prepare pdf-output (if pdfOneDoc == nein)
-    if config_pdfOneDoc == 'nein':
-      output_filename = row[2] + "_" + row[1] + "_" + row[0] + "_" + today + ".pdf"
+
+  # display expected results for ANTON-users
+  print("")
+  print("Hier eine Übersicht der importierten Nutzer (max. 100 Zeilen):")
+  print("")
+  print(tabulate(df.head(100).values.tolist(), headers=df.columns.tolist()))
+
+  # ask user to check values and continue
+  print("\nÜberprüfe, ob die Daten für die zu generierenden PDF-Dateien korrekt sind.")
+  input("Wenn alles gut aussieht, drücke eine beliebige Taste, um fortzufahren. Wenn nicht, drücke Strg+C, um abzubrechen.")
+  print("\nUnd los geht's. Ich erstelle nun die PDF-Datei(en).\n")
+  print("\nDies kann eine Weile dauern. Gönn dir einen Kaffee oder Tee.\n")
+
+  cfg = RenderConfig(
+    pdfOneDoc=config_pdfOneDoc,
+    schoolgroup=config_schoolgroup,
+    output_dir=output_dir,
+    today=today,
+  )
+
+  # render all users in parallel; each worker produces one PDF (or one page of the merged document)
+  with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+    results = executor.map(partial(render_user, cfg=cfg), rows, chunksize=8)
+    if config_pdfOneDoc == 'ja':
+      # create pdf-file (one document): merge the single-page PDFs returned by the workers
+      output_filename = "Nutzerliste_" + today + ".pdf"
       output_filepath = os.path.join( output_dir, output_filename )
-      doc = SimpleDocTemplate(output_filepath, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=18, bottomMargin=18)
-
-    antonlogo = "assets/ANTON_Logo.jpg" # ANTON-Logo
-    if config_schoolgroup == '1': #Schüler
-      antonfirstname = row[0]
-      antonsurname = row[1]
-      antonclass = row[2]
-      antonreference = row[3]
-      antonlogincode = row[4]
-      antonlink = "https://www.anton.app"
-        
-    if config_schoolgroup == '2': #Lehrer
-      antonfirstname = row[0]
-      antonsurname = row[1]
-      antonclass = row[2]
-      antonreference = row[3]
-      antonlogincode = row[4]
-      antonlink = "https://www.anton.app"
-        
-    # adds anton-logo to pdf-file 
-    im = Image(antonlogo, 150, 150)
-    Story.append(im)
-    #Story.append(Spacer(1, 12))
-
-    styles=getSampleStyleSheet()
-    styles.add(ParagraphStyle(name='Justify', alignment=TA_JUSTIFY))
-
-    # adds text to pdf-file   
-    ptext = '<font size=14>Hallo %s!</font>' % antonfirstname
-    Story.append(Paragraph(ptext, styles["Justify"]))
-    Story.append(Spacer(1, 12))
-
-    ptext = '<font size=14>Willkommen bei ANTON – der Lern-App für die Schule.</font>'
-    Story.append(Paragraph(ptext, styles["Normal"]))
-    Story.append(Spacer(1, 12))
-
-    ptext = '<font size=14>Für dich wurde ein Account angelegt.</font>'
-    Story.append(Paragraph(ptext, styles["Normal"]))
-    Story.append(Spacer(1, 24))
-
-    ptext = '<font size=14>Gehe im Browser auf </font>'
-    Story.append(Paragraph(ptext, styles["Normal"]))
-    Story.append(Spacer(1, 12))
-
-    ptext = '<font size=18>%s</font>' % antonlink
-    Story.append(Paragraph(ptext, styles["Normal"]))
-    Story.append(Spacer(1, 12))
-
-    ptext = '<font size=14>oder lade dir die kostenlose ANTON-App herunter.</font>'
-    Story.append(Paragraph(ptext, styles["Normal"]))
-    Story.append(Spacer(1, 24))      
-
-    ptext = '<font size=14>Du kannst dich mit folgendem Code bei ANTON einloggen:</font>'
-    Story.append(Paragraph(ptext, styles["Normal"]))
-    Story.append(Spacer(1, 24))
-
-    ptext = '<font size=24>%s</font>' % antonlogincode
-    Story.append(Paragraph(ptext, styles["Heading1"]))
-    Story.append(Spacer(1, 24))
-
-    ptext = '<font size=14>Oder du scannst in der ANTON-App diesen QR-Code:</font>'
-    Story.append(Paragraph(ptext, styles["Normal"]))
-    Story.append(Spacer(1, 12))         
-
-    # adds qr-code to pdf-file
-    im2 = Image(os.path.join( tmp_dir, row[2] + "_" + row[1] + "_" + row[0] + ".jpg" ), 200, 200)
-    Story.append(im2)
-    del im2
-    if config_pdfOneDoc == 'nein':
-      # create pdf-file (single documents)
-      doc.build(Story)	  
+      writer = PdfWriter()
+      # pages are appended as worker results stream in, so no per-user
+      # Story/Flowable graphs accumulate in the main process
+      for pdf_bytes in results:
+        writer.append(io.BytesIO(pdf_bytes))
+      with open(output_filepath, 'wb') as f:
+        writer.write(f)
     else:
-      Story.append(PageBreak())
-
-      # create pdf-file (one document)
-if config_pdfOneDoc == 'ja':
-  doc.build(Story)
-
-# Clean up tmp-folder
-filelist = [ f for f in os.listdir(tmp_dir) ]
-for f in filelist:
-    os.remove(os.path.join(tmp_dir, f))
-
-print("")
-print("###################################################################################")
-print("# Es wurde für jeden Nutzer eine PDF-Seite mit Infos zur Anmeldung generiert.     #")
-print("# Du findest die Datei(en) im Unterordner 'output'!                               #")
-print("###################################################################################")
-print("")
-input("Drücke eine beliebige Taste, um den Prozess zu beenden.")
+      # create pdf-files (single documents): just drain the iterator
+      for _ in results:
+        pass
+
+  print("")
+  print("###################################################################################")
+  print("# Es wurde für jeden Nutzer eine PDF-Seite mit Infos zur Anmeldung generiert.     #")
+  print("# Du findest die Datei(en) im Unterordner 'output'!                               #")
+  print("###################################################################################")
+  print("")
+  input("Drücke eine beliebige Taste, um den Prozess zu beenden.")
+
+
+if __name__ == '__main__':
+  # Nötig für den Prozess-Pool in gefrorenen Windows-Builds
+  multiprocessing.freeze_support()
+  main()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import multiprocessing
 import os
 import sys
 
@@ -15,5 +16,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Nötig für den PDF-Prozess-Pool in gefrorenen Windows-Builds
+    multiprocessing.freeze_support()
     main()
 
@@ -1 +1 @@
-# macht den Ordner zu einem Python-Paket
+# macht den Ordner zu einem Python-Paket
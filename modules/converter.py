@@ -2,13 +2,15 @@
 
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 import re
-import pandas as pd
+import csv
 
 from .io_utils import resolve_path, ensure_dir
 
+_KLASSE_RE = re.compile(r"klasse-([^-\s]+)", re.IGNORECASE)
+
 
 def _xml_ns(root: ET.Element) -> Dict[str, str]:
     tag = root.tag
@@ -18,6 +20,22 @@ def _xml_ns(root: ET.Element) -> Dict[str, str]:
     return {"ns": ""}
 
 
+def _iter_toplevel(xml_abs: str, local_tag: str) -> Iterator[Tuple[ET.Element, Dict[str, str]]]:
+    """Stream top-level elements with the given local tag via iterparse.
+
+    Yields (element, ns) pairs; already-processed elements are dropped from
+    the root after each yield, so memory stays O(1) in the document size.
+    """
+    context = ET.iterparse(xml_abs, events=("start", "end"))
+    _, root = next(context)
+    ns = _xml_ns(root)
+    tag = f"{{{ns['ns']}}}{local_tag}" if ns["ns"] else local_tag
+    for event, elem in context:
+        if event == "end" and elem.tag == tag:
+            yield elem, ns
+            root.clear()
+
+
 def _get_text_ns(el: ET.Element, path: str, ns: Dict[str, str], default: str = "") -> str:
     try:
         node = el.find(path, ns)
@@ -43,30 +61,46 @@ def _norm_klasse(raw: str) -> str:
 def _klasse_from_membership_id(group_id: str) -> str:
     if not group_id:
         return ""
-    match = re.search(r"klasse-([^-\s]+)", group_id, re.IGNORECASE)
+    match = _KLASSE_RE.search(group_id)
     if match:
         return match.group(1)
     return ""
 
 
-def _build_membership_class_map(root: ET.Element, ns: Dict[str, str]) -> Dict[str, str]:
+def _build_membership_class_map(xml_abs: str) -> Dict[str, str]:
     result: Dict[str, str] = {}
-    for membership in root.findall("ns:membership", ns):
-        group_id = _get_text_ns(membership, "ns:sourcedid/ns:id", ns)
-        klasse_raw = _klasse_from_membership_id(group_id)
-        klasse = _norm_klasse(klasse_raw)
-        if not klasse:
+    member_tag = ""
+    id_path = ""
+    for membership, ns in _iter_toplevel(xml_abs, "membership"):
+        if not member_tag:
+            # Qualifizierte Tag-Namen einmal vorberechnen -> schneller Tag-Match-Pfad
+            prefix = f"{{{ns['ns']}}}" if ns["ns"] else ""
+            member_tag = prefix + "member"
+            id_path = f"{prefix}sourcedid/{prefix}id"
+        try:
+            node = membership.find(id_path)
+            group_id = (node.text or "").strip() if node is not None else ""
+            klasse = _norm_klasse(_klasse_from_membership_id(group_id))
+            if not klasse:
+                continue
+            # Direkter Zugriff ohne try/except pro member; Fehler fängt der äußere Block
+            for member in membership.iter(member_tag):
+                id_node = member.find(id_path)
+                if id_node is not None and id_node.text:
+                    result[id_node.text.strip()] = klasse
+        except Exception:
             continue
-        for member in membership.findall("ns:member", ns):
-            person_id = _get_text_ns(member, "ns:sourcedid/ns:id", ns)
-            if person_id:
-                result[person_id] = klasse
     return result
 
 
 def _split_name(person: ET.Element, ns: Dict[str, str]) -> Tuple[str, str]:
-    given = _get_text_ns(person, "ns:name/ns:n/ns:given", ns)
-    family = _get_text_ns(person, "ns:name/ns:n/ns:family", ns)
+    # Ein gemeinsamer Subtree-Lookup statt zweier voller Pfad-Traversierungen pro Person
+    n = person.find("ns:name/ns:n", ns)
+    if n is not None:
+        given = _get_text_ns(n, "ns:given", ns)
+        family = _get_text_ns(n, "ns:family", ns)
+    else:
+        given = family = ""
     if not given and not family:
         full = _get_text_ns(person, "ns:name/ns:fn", ns)
         if full:
@@ -91,35 +125,34 @@ def _anrede_from_reference(ref: str) -> str:
     - Middle token (here: 2409843) last digit denotes gender: 3=male, 4=female
     Returns "Herr", "Frau" or "" if not detectable.
     """
-    try:
-        if not ref:
-            return ""
-        parts = str(ref).strip().split("-")
-        if len(parts) >= 2:
-            middle = parts[1]
-            if middle and middle[-1] in ("3", "4"):
-                return "Herr" if middle[-1] == "3" else "Frau"
-    except Exception:
-        pass
+    if not ref:
+        return ""
+    parts = str(ref).strip().split("-")
+    if len(parts) >= 2:
+        middle = parts[1]
+        if middle and middle[-1] in ("3", "4"):
+            return "Herr" if middle[-1] == "3" else "Frau"
     return ""
 
 
-def _is_student(person: ET.Element, ns: Dict[str, str]) -> bool:
+def _classify(person: ET.Element, ns: Dict[str, str]) -> str:
+    """Classify a person as "student", "teacher" or "" in a single role pass."""
+    is_student = False
+    is_teacher = False
     for r in person.findall("ns:institutionrole", ns):
         t = (r.get("institutionroletype") or "").strip().lower()
         if t == "student":
-            return True
-    return False
-
-
-def _is_teacher_like(person: ET.Element, ns: Dict[str, str]) -> bool:
-    for r in person.findall("ns:institutionrole", ns):
-        t = (r.get("institutionroletype") or "").strip().lower()
-        if t in {"faculty", "extern", "teacher", "staff"}:
-            return True
-    if not _is_student(person, ns) and _get_text_ns(person, "ns:email", ns):
-        return True
-    return False
+            is_student = True
+        elif t in {"faculty", "extern", "teacher", "staff"}:
+            is_teacher = True
+    if is_student:
+        return "student"
+    if is_teacher:
+        return "teacher"
+    # Kein Rollen-Tag: Personen mit E-Mail-Adresse werden als Lehrkraft gewertet
+    if _get_text_ns(person, "ns:email", ns):
+        return "teacher"
+    return ""
 
 
 class ANTONConverter:
@@ -134,51 +167,64 @@ class ANTONConverter:
         if not os.path.isfile(xml_abs):
             raise FileNotFoundError(f"XML-Datei nicht gefunden: {xml_abs}")
 
-        tree = ET.parse(xml_abs)
-        root = tree.getroot()
-        ns = _xml_ns(root)
-        klasse_lookup = _build_membership_class_map(root, ns)
-
-        schueler_rows: List[Dict[str, str]] = []
-        lehr_rows: List[Dict[str, str]] = []
-
-        for person in root.findall("ns:person", ns):
-            try:
-                if _is_student(person, ns):
-                    vorname, nachname = _split_name(person, ns)
-                    ref = _read_reference(person, ns)
-                    klasse = klasse_lookup.get(ref, "")
-                    if vorname or nachname:
-                        schueler_rows.append({
+        klasse_lookup = _build_membership_class_map(xml_abs)
+
+        # Zeilen werden direkt beim Parsen in die CSV-Dateien geschrieben
+        # (keine Zwischenlisten); Dateien entstehen erst bei der ersten Zeile,
+        # damit leere Ausgaben wie bisher gar nicht erst angelegt werden.
+        out_files: Dict[str, str] = {}
+        writers: Dict[str, csv.DictWriter] = {}
+        handles: List = []
+
+        def _writer(key: str, filename: str, fieldnames: List[str]) -> csv.DictWriter:
+            w = writers.get(key)
+            if w is None:
+                path = os.path.join(self.output_dir, filename)
+                fp = open(path, "w", encoding="utf-8-sig", newline="")
+                handles.append(fp)
+                w = csv.DictWriter(fp, fieldnames=fieldnames, delimiter=";")
+                w.writeheader()
+                writers[key] = w
+                out_files[key] = path
+            return w
+
+        try:
+            for person, ns in _iter_toplevel(xml_abs, "person"):
+                try:
+                    role = _classify(person, ns)
+                    if role == "student":
+                        vorname, nachname = _split_name(person, ns)
+                        ref = _read_reference(person, ns)
+                        klasse = klasse_lookup.get(ref, "")
+                        if vorname or nachname:
+                            _writer(
+                                "schueler_csv",
+                                f"{self.dt_string}_ANTON_Schueler.csv",
+                                ["Vorname", "Nachname", "Klasse", "Referenz"],
+                            ).writerow({
+                                "Vorname": vorname,
+                                "Nachname": nachname,
+                                "Klasse": klasse,
+                                "Referenz": ref,
+                            })
+                    elif role == "teacher":
+                        vorname, nachname = _split_name(person, ns)
+                        ref = _read_reference(person, ns)
+                        anrede = _anrede_from_reference(ref)
+                        _writer(
+                            "lehrkraefte_csv",
+                            f"{self.dt_string}_ANTON_Lehrkraefte.csv",
+                            ["Anrede", "Vorname", "Nachname", "Referenz"],
+                        ).writerow({
+                            "Anrede": anrede,
                             "Vorname": vorname,
                             "Nachname": nachname,
-                            "Klasse": klasse,
                             "Referenz": ref,
                         })
-                elif _is_teacher_like(person, ns):
-                    vorname, nachname = _split_name(person, ns)
-                    ref = _read_reference(person, ns)
-                    anrede = _anrede_from_reference(ref)
-                    lehr_rows.append({
-                        "Anrede": anrede,
-                        "Vorname": vorname,
-                        "Nachname": nachname,
-                        "Referenz": ref,
-                    })
-            except Exception:
-                continue
-
-        df_s = pd.DataFrame(schueler_rows, columns=["Vorname", "Nachname", "Klasse", "Referenz"])
-        df_l = pd.DataFrame(lehr_rows, columns=["Anrede", "Vorname", "Nachname", "Referenz"])
-
-        out_files: Dict[str, str] = {}
-        if not df_s.empty:
-            f_s = os.path.join(self.output_dir, f"{self.dt_string}_ANTON_Schueler.csv")
-            df_s.to_csv(f_s, sep=';', index=False, encoding='utf-8-sig')
-            out_files["schueler_csv"] = f_s
-        if not df_l.empty:
-            f_l = os.path.join(self.output_dir, f"{self.dt_string}_ANTON_Lehrkraefte.csv")
-            df_l.to_csv(f_l, sep=';', index=False, encoding='utf-8-sig')
-            out_files["lehrkraefte_csv"] = f_l
+                except Exception:
+                    continue
+        finally:
+            for fp in handles:
+                fp.close()
 
         return out_files
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import copy
 import csv
+import functools
+import html
+import io
+import operator
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from reportlab.lib.enums import TA_JUSTIFY
 from reportlab.lib.pagesizes import A4
@@ -40,28 +45,176 @@ from .io_utils import resolve_path, ensure_dir, pause
 from .settings import Settings
 
 
-def _register_unicode_font() -> str:
-    local_dejavu = resolve_path("assets/dejavu-fonts-ttf/ttf/DejaVuSans.ttf")
-    candidates = [
-        local_dejavu,
+@functools.lru_cache(maxsize=1)
+def _find_unicode_font() -> str:
+    """Find the first existing Unicode TTF; cached so the stats run once.
+
+    Die mitgelieferte DejaVu-Schrift hat Vorrang, danach werden die
+    Systempfade des laufenden Betriebssystems zuerst geprüft.
+    """
+    candidates = [resolve_path("assets/dejavu-fonts-ttf/ttf/DejaVuSans.ttf")]
+    win_fonts = [
         os.path.join(os.environ.get("WINDIR", r"C:\\Windows"), "Fonts", "arial.ttf"),
         os.path.join(os.environ.get("WINDIR", r"C:\\Windows"), "Fonts", "Calibri.ttf"),
+    ]
+    posix_fonts = [
         "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
         "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
         "/Library/Fonts/Arial.ttf",
         "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
     ]
-    font_name = "AppUnicode"
+    if os.name == "nt":
+        candidates += win_fonts + posix_fonts
+    else:
+        candidates += posix_fonts + win_fonts
     for path in candidates:
         try:
             if path and os.path.isfile(path):
-                pdfmetrics.registerFont(TTFont(font_name, path))
-                return font_name
-        except Exception:
+                return path
+        except OSError:
             continue
+    return ""
+
+
+@functools.lru_cache(maxsize=1)
+def _register_unicode_font() -> str:
+    # lru_cache: registerFont läuft einmal pro Prozess, egal wie viele
+    # PDFGenerator-Instanzen angelegt werden
+    path = _find_unicode_font()
+    if path:
+        try:
+            pdfmetrics.registerFont(TTFont("AppUnicode", path))
+            return "AppUnicode"
+        except Exception:
+            pass
     return "Helvetica"
 
 
+# Unterhalb dieser Zeilenzahl lohnt der Prozess-Pool-Start nicht
+_PARALLEL_MIN_ROWS = 16
+
+
+# Feste Seitengeometrie für alle erzeugten Dokumente. ReportLab-Doc-Objekte
+# halten Render-Zustand und lassen sich nicht sicher über mehrere build()s
+# wiederverwenden, daher bleibt es bei einem frischen SimpleDocTemplate pro
+# Datei mit geteilten Parametern. pageCompression wird explizit gesetzt,
+# damit das Verhalten nicht von der lokalen rl_config abhängt; eine
+# zlib-Stufe kennt die öffentliche ReportLab-API nicht.
+_DOC_KW = dict(
+    pagesize=A4,
+    rightMargin=72,
+    leftMargin=72,
+    topMargin=18,
+    bottomMargin=18,
+    pageCompression=1,
+)
+
+
+# Kandidaten für die Code-Schriftgröße auf dem Sticker, absteigend sortiert
+_CODE_FONT_SIZES = (28, 26, 24, 22, 20, 18, 16, 14, 12, 10, 9, 8)
+
+
+# Markup-Vorlagen einmal auf Modulebene; dynamische Felder kommen per
+# %-Formatierung (C-Ebene) und html.escape hinein, statt die Strings pro
+# Zeile als f-String neu zusammenzusetzen
+_T_SIZE14 = "<font size=14>%s</font>"
+_T_LINK = "<font size=18>%s</font>"
+_T_CODE = "<font size=24>%s</font>"
+
+_TXT_WELCOME = "<font size=14>Willkommen bei ANTON - der Lern-App für die Schule.</font>"
+_TXT_ACCOUNT_SIE = "<font size=14>Für Sie wurde ein Account angelegt.</font>"
+_TXT_ACCOUNT_DU = "<font size=14>Für dich wurde ein Account angelegt.</font>"
+_TXT_BROWSER_SIE = "<font size=14>Gehen Sie im Browser auf </font>"
+_TXT_BROWSER_DU = "<font size=14>Gehe im Browser auf </font>"
+_TXT_APP_SIE = "<font size=14>oder laden Sie die kostenlose ANTON-App herunter.</font>"
+_TXT_APP_DU = "<font size=14>oder lade dir die kostenlose ANTON-App herunter.</font>"
+_TXT_CODE_SIE = "<font size=14>Sie können sich mit folgendem Code bei ANTON einloggen:</font>"
+_TXT_CODE_DU = "<font size=14>Du kannst dich mit folgendem Code bei ANTON einloggen:</font>"
+_TXT_QR_SIE = "<font size=14>Oder Sie scannen in der ANTON-App diesen QR-Code:</font>"
+_TXT_QR_DU = "<font size=14>Oder du scannst in der ANTON-App diesen QR-Code:</font>"
+
+
+# TableStyle ist unveränderlich -> einmal auf Modulebene anlegen
+_DIVIDER_TABLE_STYLE = TableStyle([
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("LEFTPADDING", (0, 0), (-1, -1), 2),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 2),
+    ("TOPPADDING", (0, 0), (-1, -1), 2),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+])
+
+
+def _s(d: Dict[str, str], k: str) -> str:
+    """Fetch a row field as stripped string; missing keys become "".
+
+    Die Reader-Zeilen sind bereits gestrippt, der strip() hier ist nur
+    Absicherung für Zeilen aus anderen Quellen.
+    """
+    v = d.get(k)
+    return v.strip() if v else ""
+
+
+@functools.lru_cache(maxsize=4096)
+def _strw(s: str, font: str, size: int) -> float:
+    """Memoized pdfmetrics.stringWidth; Namen/Codes wiederholen sich über Zeilen."""
+    return pdfmetrics.stringWidth(s, font, size)
+
+
+def _encode_qr(code: str):
+    """Encode one login code into a QR widget; runs on a worker thread."""
+    if not code:
+        return None
+    widget = rl_qr.QrCodeWidget(code)
+    widget.getBounds()  # erzwingt die Reed-Solomon-Kodierung schon im Thread
+    return widget
+
+
+# Ein PDFGenerator pro Worker-Prozess, angelegt vom Pool-Initializer;
+# so werden Stylesheet und Logo nicht pro Auftrag neu aufgebaut
+_worker_gen: Optional["PDFGenerator"] = None
+
+
+def _init_worker(settings: Settings) -> None:
+    global _worker_gen
+    _worker_gen = PDFGenerator(settings)
+
+
+def _build_one_pdf_job(people: List[Dict[str, str]], output_filepath: str) -> str:
+    """Pool entry point; top-level and picklable for ProcessPoolExecutor."""
+    return _build_one_pdf(_worker_gen, people, output_filepath)
+
+
+def _build_one_pdf(gen: "PDFGenerator", people: List[Dict[str, str]], output_filepath: str) -> str:
+    """Build one PDF document for the given rows with an existing generator."""
+    story: List = []
+    last = len(people)
+    # Bei Sammeldokumenten kodieren Threads die QR-Codes vor, während der
+    # Hauptthread die Story der jeweils vorigen Person aufbaut
+    pool = ThreadPoolExecutor(max_workers=4) if last > 1 else None
+    try:
+        if pool is not None:
+            futures = [pool.submit(_encode_qr, _s(r, "Code")) for r in people]
+        else:
+            futures = [None] * last
+        for idx, (r, fut) in enumerate(zip(people, futures), start=1):
+            qr_widget = fut.result() if fut is not None else None
+            story.extend(gen._build_anton_story(r, qr_widget=qr_widget))
+            # Nur zwischen Einträgen einen PageBreak einfügen
+            if idx < last:
+                story.append(PageBreak())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    # In den Speicher rendern und die Datei in einem einzigen Schreibzugriff
+    # ablegen; das erspart die vielen kleinen Einzel-Writes von ReportLab
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, **_DOC_KW)
+    doc.build(story)
+    with open(output_filepath, "wb") as f:
+        f.write(buf.getbuffer())
+    return output_filepath
+
+
 def _make_styles(font_name: str):
     styles = getSampleStyleSheet()
     for key in ("Normal", "BodyText", "Title", "Heading1", "Heading2", "Heading3"):
@@ -81,6 +234,24 @@ class PDFGenerator:
         self._font_name = _register_unicode_font()
         self.styles = _make_styles(self._font_name)
 
+        # Logo einmal auflösen und vermessen statt pro Zeile; der
+        # ImageReader dient nur der Größenbestimmung, platypus.Image
+        # bekommt den Pfad. Ohne lesbares Logo fällt die Ausgabe wie
+        # bisher auf Seiten ohne Logo zurück.
+        self._anton_logo = resolve_path("assets/ANTON.png")
+        try:
+            self._logo_size = ImageReader(self._anton_logo).getSize()
+        except Exception:
+            self._logo_size = None
+        iw, ih = self._logo_size or (0, 0)
+        self._logo_target_w = 150
+        self._logo_target_h = (self._logo_target_w / iw) * ih if iw else 150
+
+        # Häufig gelesene Einstellungen einmal normalisieren statt pro Zeile
+        self._anton_link = (self.s.pdf_antonlink or "https://www.anton.app").strip() or "https://www.anton.app"
+        self._group = str(getattr(self.s, "pdf_schoolgroup", "1")).strip() or "1"
+        self._force_teacher = (self._group == "2")
+
     def generate(self) -> None:
         """Generate ANTON PDFs from a CSV."""
         csv_path = resolve_path(self.s.csv_file)
@@ -90,13 +261,7 @@ class PDFGenerator:
             pause()
             raise FileNotFoundError(csv_path)
 
-        rows = self._read_anton_csv(csv_path, delimiter=(self.s.csv_delimiter or ","))
-        if not rows:
-            print("Keine Datenzeilen in der CSV gefunden.")
-            pause()
-            return
-        total = len(rows)
-        next_progress = 10
+        rows_iter = self._iter_anton_csv(csv_path, delimiter=(self.s.csv_delimiter or "").strip())
 
         onedoc_setting = str(getattr(self.s, "pdf_onedoc", "")).strip().lower()
         if onedoc_setting:
@@ -104,72 +269,117 @@ class PDFGenerator:
         else:
             one_doc = (str(self.s.pdf_einzeln).strip().lower() != "ja")
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        anton_logo = resolve_path("assets/ANTON.png")
-        group_setting = str(getattr(self.s, "pdf_schoolgroup", "1")).strip() or "1"
 
         if one_doc:
-            classes: Dict[str, List[Dict[str, str]]] = defaultdict(list)
-            for r in rows:
-                cls_raw = (r.get("Klasse") or "").strip()
+            # Zeilen strömen direkt in die Klassen-Gruppierung, ohne
+            # Zwischenliste aller Zeilen; Methoden-Lookups sind aus der
+            # Schleife gehoben
+            classes: Dict[str, List[Dict[str, str]]] = {}
+            group = classes.setdefault
+            teacher_default = self._force_teacher
+            for r in rows_iter:
+                cls_raw = _s(r, "Klasse")
                 # Lehrkräfte haben oft keine Klassenangabe -> packe sie in "Lehrkräfte"
-                if not cls_raw and (group_setting == "2" or (r.get("Anrede") or "").strip()):
+                if not cls_raw and (teacher_default or _s(r, "Anrede")):
                     cls = "Lehrkräfte"
                 else:
                     cls = cls_raw or "ohne_klasse"
-                classes[cls].append(r)
+                group(cls, []).append(r)
+
+            total = sum(len(people) for people in classes.values())
+            if not total:
+                print("Keine Datenzeilen in der CSV gefunden.")
+                pause()
+                return
 
-            processed = 0
+            jobs: List[Tuple[List[Dict[str, str]], str]] = []
             for cls, people in classes.items():
                 if cls == "Lehrkräfte":
                     output_filename = f"Lehrkräfte_Zugangsdaten_{timestamp}.pdf"
                 else:
                     output_filename = f"{cls}_ANTON-Zugangsdaten_{timestamp}.pdf"
-                output_filepath = os.path.join(self.output_dir, output_filename)
-                doc = SimpleDocTemplate(output_filepath, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=18, bottomMargin=18)
-                story: List = []
-
-                for idx, r in enumerate(people, start=1):
-                    processed += 1
-                    pct = int(processed * 100 / total) if total else 100
-                    if pct >= next_progress:
-                        print(f"Fortschritt: {pct}% ({processed}/{total})")
-                        next_progress += 10
-                    story.extend(self._build_anton_story(r, anton_logo))
-                    # Nur zwischen Einträgen einen PageBreak einfügen
-                    if idx < len(people):
-                        story.append(PageBreak())
-
-                doc.build(story)
+                jobs.append((people, os.path.join(self.output_dir, output_filename)))
         else:
-            for idx, r in enumerate(rows, start=1):
-                pct = int(idx * 100 / total) if total else 100
-                if pct >= next_progress:
-                    print(f"Fortschritt: {pct}% ({idx}/{total})")
-                    next_progress += 10
-                chunk = self._build_anton_story(r, anton_logo)
-                first_given = (r.get("Vorname") or "").split()[0] if r.get("Vorname") else ""
+            # Einzel-PDFs brauchen die Gesamtzahl für Fortschritt/Pool-Schwelle
+            rows = list(rows_iter)
+            if not rows:
+                print("Keine Datenzeilen in der CSV gefunden.")
+                pause()
+                return
+            total = len(rows)
+            jobs = []
+            for r in rows:
+                vorname = _s(r, "Vorname")
+                first_given = vorname.split()[0] if vorname else ""
                 person_name = f"{r.get('Klasse','')}_{r.get('Nachname','')},{first_given}".strip("_")
                 output_filename = f"{person_name}_{timestamp}.pdf"
-                output_filepath = os.path.join(self.output_dir, output_filename)
-                doc = SimpleDocTemplate(output_filepath, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=18, bottomMargin=18)
-                doc.build(chunk)
+                jobs.append(([r], os.path.join(self.output_dir, output_filename)))
+
+        self._run_jobs(jobs, total)
 
         print(f"PDFs erstellt. Ausgabeordner: {self.output_dir}")
         pause()
 
+    def _run_jobs(self, jobs: List[Tuple[List[Dict[str, str]], str]], total: int) -> None:
+        """Build all PDF jobs, on a process pool when the run is large enough."""
+        processed = 0
+        next_progress = 10
+
+        def report(n: int) -> None:
+            nonlocal processed, next_progress
+            processed += n
+            pct = int(processed * 100 / total) if total else 100
+            if pct >= next_progress:
+                print(f"Fortschritt: {pct}% ({processed}/{total})")
+                while next_progress <= pct:
+                    next_progress += 10
+
+        if total >= _PARALLEL_MIN_ROWS and len(jobs) > 1:
+            with ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_worker,
+                initargs=(self.s,),
+            ) as ex:
+                futures = {ex.submit(_build_one_pdf_job, people, path): len(people) for people, path in jobs}
+                for fut in as_completed(futures):
+                    fut.result()
+                    report(futures[fut])
+        else:
+            for people, path in jobs:
+                _build_one_pdf(self, people, path)
+                report(len(people))
+
     # Helpers
-    def _read_anton_csv(self, path: str, *, delimiter: str = ",") -> List[Dict[str, str]]:
-        rows: List[Dict[str, str]] = []
+    def _iter_anton_csv(self, path: str, *, delimiter: str = "") -> Iterator[Dict[str, str]]:
+        """Yield ANTON rows lazily; callers group or collect them as needed."""
         with open(path, "r", encoding="utf-8", newline="") as f:
-            first_line = f.readline()
-            if ";" in first_line and delimiter == ",":
-                delimiter = ";"
+            sample = f.read(65536)
             f.seek(0)
-            reader = csv.reader(f, delimiter=delimiter)
+            if not delimiter:
+                # Nur sniffen, wenn kein Trennzeichen konfiguriert ist:
+                # Zeichen im ersten 4-KiB-Sample zählen; Konsistenz (Anzahl
+                # ohne Rest durch die Zeilenzahl teilbar) schlägt reine
+                # Häufigkeit
+                head = sample[:4096]
+                newlines = head.count("\n")
+                best_count = 0
+                for cand in (";", ",", "\t", "|"):
+                    cnt = head.count(cand)
+                    if cnt > best_count and (not newlines or cnt % newlines == 0):
+                        delimiter = cand
+                        best_count = cnt
+                if not delimiter:
+                    delimiter = ";"
+            if '"' in sample:
+                reader = csv.reader(f, delimiter=delimiter)
+            else:
+                # Quote-freier Schnellpfad: ohne Anführungszeichen reicht
+                # str.split und spart den zeichenweisen csv-Tokenizer
+                reader = (line.split(delimiter) for line in f.read().splitlines())
             try:
                 header = next(reader)
             except StopIteration:
-                return []
+                return
             hdr_norm = [(h or "").strip().lower() for h in header]
 
             def idx(name: str) -> int:
@@ -192,23 +402,23 @@ class PDFGenerator:
 
             assume = (min([x for x in (i_v, i_n, i_k, i_r) if x != -1] or [-1]) == -1)
 
+            # Kompilierter Feld-Picker statt sechs Index-/len()-Checks pro
+            # Zeile; -1-Spalten zeigen auf ein angehängtes Sentinel-Feld ""
+            indices = (i_anrede, i_v, i_n, i_k, i_r, i_c)
+            real = [i for i in indices if i != -1]
+            width = (max(real) + 1) if real else 0
+            picker = operator.itemgetter(*(i if i != -1 else width for i in indices))
+
             for row in reader:
                 if not row:
                     continue
                 if assume:
-                    v = (row[0] if len(row) > 0 else "").strip()
-                    n = (row[1] if len(row) > 1 else "").strip()
-                    k = (row[2] if len(row) > 2 else "").strip()
-                    r = (row[3] if len(row) > 3 else "").strip()
-                    c = (row[4] if len(row) > 4 else "").strip()
+                    padded = row[:5] + [""] * (5 - len(row))
+                    v, n, k, r, c = map(str.strip, padded)
                     anr = ""
                 else:
-                    anr = (row[i_anrede] if i_anrede != -1 and len(row) > i_anrede else "").strip()
-                    v = (row[i_v] if i_v != -1 and len(row) > i_v else "").strip()
-                    n = (row[i_n] if i_n != -1 and len(row) > i_n else "").strip()
-                    k = (row[i_k] if i_k != -1 and len(row) > i_k else "").strip()
-                    r = (row[i_r] if i_r != -1 and len(row) > i_r else "").strip()
-                    c = (row[i_c] if i_c != -1 and len(row) > i_c else "").strip()
+                    padded = row[:width] + [""] * (width - len(row)) + [""]
+                    anr, v, n, k, r, c = map(str.strip, picker(padded))
                     # Fallback auf erste Spalten, falls Inhalte leer waren
                     if not v and len(row) > 0:
                         v = (row[0] or "").strip()
@@ -216,18 +426,19 @@ class PDFGenerator:
                         n = (row[1] or "").strip()
                 if not (v or n):
                     continue
-                rows.append({
+                yield {
                     "Anrede": anr,
                     "Vorname": v,
                     "Nachname": n,
                     "Klasse": k,
                     "Referenz": r,
                     "Code": c,
-                })
-        return rows
+                }
 
-    def _qr_drawing(self, data: str, size: int = 200) -> Drawing:
-        qr_code = rl_qr.QrCodeWidget(data)
+    def _qr_drawing(self, data: str, size: int = 200, widget=None) -> Drawing:
+        # Ein bereits kodiertes Widget kann übergeben werden; die teure
+        # Reed-Solomon-Kodierung läuft dann nur einmal pro Code
+        qr_code = widget if widget is not None else rl_qr.QrCodeWidget(data)
         bounds = qr_code.getBounds()
         width = bounds[2] - bounds[0]
         height = bounds[3] - bounds[1]
@@ -235,32 +446,30 @@ class PDFGenerator:
         drawing.add(qr_code)
         return drawing
 
-    def _divider(self) -> Table:
-        """Scissor icon with horizontal line to visually separate sections."""
+    @functools.cached_property
+    def _divider_flowable(self) -> Table:
+        """Scissor icon with horizontal line to visually separate sections.
+
+        Der Trenner ist für alle Seiten identisch und wird deshalb nur einmal
+        pro Generator gebaut.
+        """
         scissor = Paragraph("<font size=14>✂</font>", self.styles["Normal"])
         hr = HRFlowable(width="100%", thickness=1, color=colors.black, spaceBefore=2, spaceAfter=2)
         tbl = Table([[scissor, hr]], colWidths=[10 * mm, None])
-        tbl.setStyle(TableStyle([
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("LEFTPADDING", (0, 0), (-1, -1), 2),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 2),
-            ("TOPPADDING", (0, 0), (-1, -1), 2),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-        ]))
+        tbl.setStyle(_DIVIDER_TABLE_STYLE)
         return tbl
 
-    def _sticker(self, firstname: str, lastname: str, code: str, anton_logo_path: str) -> Table:
+    def _sticker(self, firstname: str, lastname: str, code: str, qr_widget=None) -> Table:
         """Create a small table-based sticker with logo, stacked name, and QR."""
-        # Logo with original aspect ratio (~25mm height)
+        # Logo with original aspect ratio (~25mm height); die Größe ist gecacht
         logo_w = 25 * mm
         logo_h = 25 * mm
-        try:
-            img_reader = ImageReader(anton_logo_path)
-            iw, ih = img_reader.getSize()
+        if self._logo_size is not None:
+            iw, ih = self._logo_size
             if iw and ih:
                 logo_w = logo_h * (iw / ih)
-            logo = Image(anton_logo_path, width=logo_w, height=logo_h)
-        except Exception:
+            logo = Image(self._anton_logo, width=logo_w, height=logo_h)
+        else:
             logo = Paragraph("", self.styles["Normal"])
 
         # Name stacked; adjust font size dynamically; fixed sticker width ~100mm (10cm)
@@ -278,17 +487,27 @@ class PDFGenerator:
         name_font = 8
         available_name_col = target_width - logo_w - (30 * mm)
 
-        # Find the largest code font that fits the available width (centered block)
+        # Find the largest code font that fits the available width (centered block).
+        # Die Breite wächst monoton mit der Schriftgröße -> Binärsuche statt
+        # linearem Scan über alle Kandidaten.
         def code_font_that_fits() -> int:
-            for fs in (28, 26, 24, 22, 20, 18, 16, 14, 12, 10, 9, 8):
-                w = max(
-                    pdfmetrics.stringWidth(code or "", font_name, fs),
-                    pdfmetrics.stringWidth(lines[0], font_name, name_font),
-                    pdfmetrics.stringWidth(lines[1], font_name, name_font),
-                ) + 2 * pad
-                if w <= available_name_col:
-                    return fs
-            return 8
+            # Die Namenszeilen sind pro Sticker konstant -> einmal messen
+            name_w = max(
+                _strw(lines[0], font_name, name_font),
+                _strw(lines[1], font_name, name_font),
+            )
+            sizes = _CODE_FONT_SIZES
+            budget = available_name_col - 2 * pad
+            if max(_strw(code or "", font_name, sizes[-1]), name_w) > budget:
+                return 8
+            lo, hi = 0, len(sizes) - 1
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if max(_strw(code or "", font_name, sizes[mid]), name_w) <= budget:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            return sizes[lo]
 
         code_font = code_font_that_fits()
         name_col = max(0, available_name_col)
@@ -296,17 +515,21 @@ class PDFGenerator:
         text = Paragraph(
             (
                 f"<para align='center'>"
-                f"<font size={name_font}>{lines[0]}<br/>{lines[1]}</font>"
+                f"<font size={name_font}>{html.escape(lines[0])}<br/>{html.escape(lines[1])}</font>"
                 f"<br/><br/>"
-                f"<font size={code_font}>{code}</font>"
+                f"<font size={code_font}>{html.escape(code)}</font>"
                 f"</para>"
             ),
             self.styles["Normal"],
         )
 
-        # QR code shrunk for sticker
+        # QR code shrunk for sticker; ein vorkodiertes Widget wird flach kopiert
+        # statt denselben Code erneut zu kodieren
         qr_size = 90  # points, larger to nearly fill the sticker height
-        qr_flow = self._qr_drawing(code or f"{first_given} {lastname}", size=qr_size)
+        if qr_widget is not None:
+            qr_flow = self._qr_drawing(code, size=qr_size, widget=copy.copy(qr_widget))
+        else:
+            qr_flow = self._qr_drawing(code or f"{first_given} {lastname}", size=qr_size)
         try:
             qr_flow.hAlign = "CENTER"
         except Exception:
@@ -326,87 +549,65 @@ class PDFGenerator:
         ]))
         return tbl
 
-    def _build_anton_story(self, r: Dict[str, str], anton_logo_path: str) -> List:
-        styles = self.styles
-        if "Justify" not in styles.byName:
-            styles.add(ParagraphStyle(name="Justify", alignment=TA_JUSTIFY, fontName=styles["Normal"].fontName))
+    def _build_anton_story(self, r: Dict[str, str], qr_widget=None) -> List:
+        # _make_styles registriert "Justify" bereits; Stile einmal als
+        # Lokale binden statt pro Absatz im Stylesheet nachzuschlagen
+        normal = self.styles["Normal"]
+        justify = self.styles["Justify"]
+        heading1 = self.styles["Heading1"]
 
         story: List = []
-        # Logo (keep aspect ratio)
-        try:
-            img_reader = ImageReader(anton_logo_path)
-            iw, ih = img_reader.getSize()
-            target_w = 150
-            target_h = (target_w / iw) * ih if iw else 150
-            im = Image(anton_logo_path, width=target_w, height=target_h)
+        # Logo (keep aspect ratio); Größe ist in __init__ vorberechnet
+        if self._logo_size is not None:
+            im = Image(self._anton_logo, width=self._logo_target_w, height=self._logo_target_h)
             im.hAlign = "CENTER"
             story.append(im)
-        except Exception:
-            pass
         story.append(Spacer(1, 12))
 
-        anrede = (r.get("Anrede") or "").strip()
-        firstname = (r.get("Vorname") or "").strip()
-        lastname = (r.get("Nachname") or "").strip()
-        code = (r.get("Code") or "").strip()
-        anton_link = (self.s.pdf_antonlink or "https://www.anton.app").strip() or "https://www.anton.app"
+        anrede = _s(r, "Anrede")
+        firstname = _s(r, "Vorname")
+        lastname = _s(r, "Nachname")
+        code = _s(r, "Code")
+        anton_link = self._anton_link
 
-        group = str(getattr(self.s, "pdf_schoolgroup", "1")).strip()
-        force_teacher = (group == "2")
-        is_teacher = force_teacher or bool(anrede)
+        is_teacher = self._force_teacher or bool(anrede)
 
         # Greeting (use first given name if multiple)
         first_given = (firstname or "").split()[0] if firstname else ""
-        if is_teacher:
-            full_name = (f"{first_given} {lastname}".strip()).strip()
-            greet = f"Hallo {full_name},"
-            story.append(Paragraph(f"<font size=14>{greet}</font>", styles["Justify"]))
+        full_name = f"{first_given} {lastname}".strip()
+        if anrede and not is_teacher:
+            greet = f"{anrede} {full_name},"
         else:
-            full_name = (f"{first_given} {lastname}".strip()).strip()
-            if anrede:
-                greet = f"{anrede} {full_name},"
-            else:
-                greet = f"Hallo {full_name},"
-            story.append(Paragraph(f"<font size=14>{greet}</font>", styles["Justify"]))
+            greet = f"Hallo {full_name},"
+        story.append(Paragraph(_T_SIZE14 % html.escape(greet), justify))
         story.append(Spacer(1, 12))
 
         # Intro text
-        story.append(Paragraph("<font size=14>Willkommen bei ANTON - der Lern-App für die Schule.</font>", styles["Normal"]))
+        story.append(Paragraph(_TXT_WELCOME, normal))
         story.append(Spacer(1, 12))
-        if is_teacher:
-            story.append(Paragraph("<font size=14>Für Sie wurde ein Account angelegt.</font>", styles["Normal"]))
-        else:
-            story.append(Paragraph("<font size=14>Für dich wurde ein Account angelegt.</font>", styles["Normal"]))
+        story.append(Paragraph(_TXT_ACCOUNT_SIE if is_teacher else _TXT_ACCOUNT_DU, normal))
         story.append(Spacer(1, 24))
 
-        if is_teacher:
-            story.append(Paragraph("<font size=14>Gehen Sie im Browser auf </font>", styles["Normal"]))
-        else:
-            story.append(Paragraph("<font size=14>Gehe im Browser auf </font>", styles["Normal"]))
+        story.append(Paragraph(_TXT_BROWSER_SIE if is_teacher else _TXT_BROWSER_DU, normal))
         story.append(Spacer(1, 12))
-        story.append(Paragraph(f"<font size=18>{anton_link}</font>", styles["Normal"]))
+        story.append(Paragraph(_T_LINK % html.escape(anton_link), normal))
         story.append(Spacer(1, 12))
 
-        if is_teacher:
-            story.append(Paragraph("<font size=14>oder laden Sie die kostenlose ANTON-App herunter.</font>", styles["Normal"]))
-        else:
-            story.append(Paragraph("<font size=14>oder lade dir die kostenlose ANTON-App herunter.</font>", styles["Normal"]))
+        story.append(Paragraph(_TXT_APP_SIE if is_teacher else _TXT_APP_DU, normal))
         story.append(Spacer(1, 24))
 
+        # Code einmal kodieren (sofern nicht schon vorkodiert übergeben);
+        # Seiten-QR und Sticker-QR teilen sich das Widget
+        if qr_widget is None and code:
+            qr_widget = rl_qr.QrCodeWidget(code)
         if code:
-            if is_teacher:
-                story.append(Paragraph("<font size=14>Sie können sich mit folgendem Code bei ANTON einloggen:</font>", styles["Normal"]))
-            else:
-                story.append(Paragraph("<font size=14>Du kannst dich mit folgendem Code bei ANTON einloggen:</font>", styles["Normal"]))
+            story.append(Paragraph(_TXT_CODE_SIE if is_teacher else _TXT_CODE_DU, normal))
             story.append(Spacer(1, 24))
-            story.append(Paragraph(f"<font size=24>{code}</font>", styles["Heading1"]))
+            story.append(Paragraph(_T_CODE % html.escape(code), heading1))
             story.append(Spacer(1, 24))
-            if is_teacher:
-                story.append(Paragraph("<font size=14>Oder Sie scannen in der ANTON-App diesen QR-Code:</font>", styles["Normal"]))
-            else:
-                story.append(Paragraph("<font size=14>Oder du scannst in der ANTON-App diesen QR-Code:</font>", styles["Normal"]))
+            story.append(Paragraph(_TXT_QR_SIE if is_teacher else _TXT_QR_DU, normal))
             story.append(Spacer(1, 12))
-            qr_flow = self._qr_drawing(code, size=200)
+            qr_flow = self._qr_drawing(code, size=200, widget=qr_widget)
             try:
                 qr_flow.hAlign = "CENTER"
             except Exception:
@@ -414,8 +615,8 @@ class PDFGenerator:
             story.append(qr_flow)
         # Divider and table sticker
         story.append(Spacer(1, 18))
-        story.append(self._divider())
+        story.append(self._divider_flowable)
         story.append(Spacer(1, 12))
-        story.append(self._sticker(firstname, lastname, code or "", anton_logo_path))
+        story.append(self._sticker(firstname, lastname, code or "", qr_widget=qr_widget))
 
         return story
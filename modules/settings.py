@@ -1,9 +1,14 @@
-﻿from dataclasses import dataclass
-import xml.etree.ElementTree as ET
-from typing import Optional
-
-
-@dataclass
+﻿from dataclasses import dataclass
+from typing import Dict, Optional
+
+try:
+    # lxml, falls vorhanden (z. B. als transitive Abhängigkeit): schnellerer C-Parser
+    from lxml import etree as ET  # type: ignore[no-redef]
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+
+@dataclass
 class Settings:
     # ANTON Konverter
     anton_xml_file: str
@@ -19,46 +24,46 @@ class Settings:
     pdf_einzeln: str = "ja"  # legacy flag, "ja" = einzelne PDFs
     pdf_onedoc: str = "nein"  # "ja" = Sammeldokument wie im alten ANTON-PDF
     pdf_schoolgroup: str = "1"  # "1"=Schüler:innen, "2"=Lehrkräfte
-
-
-def _get_text(root: ET.Element, tag: str, default: str = "") -> str:
-    el = root.find(tag)
-    return el.text.strip() if el is not None and el.text is not None else default
-
-
-def _warn_invalid(raw: str, varname: str, default: str) -> None:
-    print(f"Ungueltiger Wert {raw!r} fuer Variable {varname!r} in der config.xml. Nutze Standardwert {default!r}")
-
-
-def _norm_yes_no(value: str, *, varname: str, default_yes: bool) -> str:
-    v_raw = value or ""
-    v = v_raw.strip().lower()
-    if v == "":
-        return "ja" if default_yes else "nein"
-    if v in ("ja", "nein"):
-        return v
-    default_str = "ja" if default_yes else "nein"
-    _warn_invalid(v_raw, varname, default_str)
-    return default_str
-
-
+
+
+def _get_text(cfg: Dict[str, Optional[str]], tag: str, default: str = "") -> str:
+    text = cfg.get(tag)
+    return text.strip() if text is not None else default
+
+
+def _warn_invalid(raw: str, varname: str, default: str) -> None:
+    print(f"Ungueltiger Wert {raw!r} fuer Variable {varname!r} in der config.xml. Nutze Standardwert {default!r}")
+
+
+def _norm_yes_no(value: str, *, varname: str, default_yes: bool) -> str:
+    v_raw = value or ""
+    v = v_raw.strip().lower()
+    if v == "":
+        return "ja" if default_yes else "nein"
+    if v in ("ja", "nein"):
+        return v
+    default_str = "ja" if default_yes else "nein"
+    _warn_invalid(v_raw, varname, default_str)
+    return default_str
+
+
 def load_settings(config_path: str) -> Settings:
-    with open(config_path, "r", encoding="utf-8") as f:
-        xml_text = f.read()
-    root = ET.fromstring(xml_text)
-
-    # ANTON-Pfade
-    anton_xml_file = _get_text(root, "anton_xml_file")
-    anton_outputpath = _get_text(root, "anton_outputpath", "output")
-
-    # CSV/PDF
-    csv_file = _get_text(root, "csv_file")
-    csv_delimiter = _get_text(root, "csv_delimiter", ";")
-    pdf_outputpath = _get_text(root, "pdf_outputpath", "pdf-files")
-    pdf_antonlink = _get_text(root, "pdf_antonlink", "https://www.anton.app")
-    pdf_einzeln_raw = _get_text(root, "pdf_einzeln", "ja")
-    pdf_onedoc_raw = _get_text(root, "pdf_onedoc", "")
-    pdf_schoolgroup_raw = _get_text(root, "pdf_schoolgroup", "1")
+    root = ET.parse(config_path).getroot()
+    # Ein Durchlauf über die Kinder statt eines find()-Scans pro Tag
+    cfg: Dict[str, Optional[str]] = {el.tag: el.text for el in root}
+
+    # ANTON-Pfade
+    anton_xml_file = _get_text(cfg, "anton_xml_file")
+    anton_outputpath = _get_text(cfg, "anton_outputpath", "output")
+
+    # CSV/PDF
+    csv_file = _get_text(cfg, "csv_file")
+    csv_delimiter = _get_text(cfg, "csv_delimiter", ";")
+    pdf_outputpath = _get_text(cfg, "pdf_outputpath", "pdf-files")
+    pdf_antonlink = _get_text(cfg, "pdf_antonlink", "https://www.anton.app")
+    pdf_einzeln_raw = _get_text(cfg, "pdf_einzeln", "ja")
+    pdf_onedoc_raw = _get_text(cfg, "pdf_onedoc", "")
+    pdf_schoolgroup_raw = _get_text(cfg, "pdf_schoolgroup", "1")
 
     pdf_einzeln = _norm_yes_no(pdf_einzeln_raw, varname="pdf_einzeln", default_yes=True)
     pdf_onedoc = _norm_yes_no(pdf_onedoc_raw, varname="pdf_onedoc", default_yes=False)
@@ -78,25 +83,29 @@ def load_settings(config_path: str) -> Settings:
         pdf_onedoc=pdf_onedoc,
         pdf_schoolgroup=pdf_schoolgroup,
     )
-
-
-def save_settings(config_path: str, s: Settings) -> None:
-    try:
-        tree = ET.parse(config_path)
-        root = tree.getroot()
-    except Exception:
-        root = ET.Element("config")
-        tree = ET.ElementTree(root)
-
-    def set_text(tag: str, value: Optional[str]) -> None:
-        el = root.find(tag)
-        if el is None:
-            el = ET.SubElement(root, tag)
-        el.text = (value or "")
-
-    # ANTON / PDF
-    set_text("anton_xml_file", s.anton_xml_file)
-    set_text("anton_outputpath", s.anton_outputpath)
+
+
+def save_settings(config_path: str, s: Settings) -> None:
+    try:
+        tree = ET.parse(config_path)
+        root = tree.getroot()
+    except Exception:
+        root = ET.Element("config")
+        tree = ET.ElementTree(root)
+
+    # Ein Durchlauf über die Kinder statt eines find()-Scans pro Tag
+    existing: Dict[str, ET.Element] = {el.tag: el for el in root}
+
+    def set_text(tag: str, value: Optional[str]) -> None:
+        el = existing.get(tag)
+        if el is None:
+            el = ET.SubElement(root, tag)
+            existing[tag] = el
+        el.text = (value or "")
+
+    # ANTON / PDF
+    set_text("anton_xml_file", s.anton_xml_file)
+    set_text("anton_outputpath", s.anton_outputpath)
     set_text("csv_file", s.csv_file)
     set_text("csv_delimiter", s.csv_delimiter)
     set_text("pdf_outputpath", s.pdf_outputpath)
@@ -104,6 +113,6 @@ def save_settings(config_path: str, s: Settings) -> None:
     set_text("pdf_einzeln", s.pdf_einzeln)
     set_text("pdf_onedoc", s.pdf_onedoc)
     set_text("pdf_schoolgroup", s.pdf_schoolgroup)
-    tree.write(config_path, encoding="utf-8", xml_declaration=False)
-
-
+    tree.write(config_path, encoding="utf-8", xml_declaration=False)
+
+